@@ -10,18 +10,359 @@ et compare les marchés obligataires traditionnels et tokenisés.
 
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-from scipy.stats import norm
-import random
-from datetime import datetime, timedelta
+from numba import njit, prange
+from datetime import datetime
 import os
-import argparse
+import multiprocessing
+import sys
+import csv
+import functools
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+
+
+@dataclass
+class MarketArrays:
+    """
+    État mutable d'un marché obligataire, stocké sous forme de tableaux NumPy parallèles
+    (une entrée par obligation) en float32 / int32 pour limiter la bande passante mémoire
+    """
+    bond_id: np.ndarray
+    face_value: np.ndarray
+    coupon_rate: np.ndarray
+    maturity_years: np.ndarray
+    price: np.ndarray
+    base_volume: np.ndarray
+    daily_volume: np.ndarray
+    bid_ask_spread: np.ndarray
+    market_depth: np.ndarray
+    is_tokenized: bool
+    
+    def __len__(self):
+        return len(self.bond_id)
+
+
+@dataclass
+class TransactionLog:
+    """
+    Journal des transactions d'un marché, stocké par colonnes dans des tableaux préalloués
+    """
+    day: np.ndarray
+    bond_idx: np.ndarray
+    investor_idx: np.ndarray
+    price: np.ndarray
+    amount: np.ndarray
+    side: np.ndarray  # 0 = achat, 1 = vente
+    size: int = 0
+    
+    @classmethod
+    def allocate(cls, capacity):
+        """
+        Préalloue un journal pouvant contenir au plus capacity transactions
+        
+        Args:
+            capacity: Nombre maximal de transactions
+        
+        Returns:
+            TransactionLog: Journal vide
+        """
+        return cls(
+            day=np.empty(capacity, np.int32),
+            bond_idx=np.empty(capacity, np.int32),
+            investor_idx=np.empty(capacity, np.int32),
+            price=np.empty(capacity, np.float32),
+            amount=np.empty(capacity, np.float32),
+            side=np.empty(capacity, np.uint8)
+        )
+    
+    def to_frame(self, market, investor_ids, start_date):
+        """
+        Convertit les transactions enregistrées en DataFrame
+        
+        Args:
+            market: État du marché dont proviennent les transactions
+            investor_ids: Identifiants des investisseurs, par position
+            start_date: Date du premier jour de la simulation
+        
+        Returns:
+            DataFrame: Une ligne par transaction
+        """
+        n = self.size
+        return pd.DataFrame({
+            'date': start_date + pd.to_timedelta(self.day[:n], unit='D'),
+            'bond_id': market.bond_id[self.bond_idx[:n]],
+            'investor_id': investor_ids[self.investor_idx[:n]],
+            'price': self.price[:n],
+            'amount': self.amount[:n],
+            'type': pd.Categorical.from_codes(self.side[:n], categories=['buy', 'sell']),
+            'is_tokenized': market.is_tokenized
+        })
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _simulate_day_kernel(prices, volumes, spreads, maturities, face_values, investor_assets,
+                         reference_rate, price_change_factor, specific_noise,
+                         bond_draws, investor_draws, side_draws, size_draws,
+                         min_amount, face_multiple, day,
+                         log_day, log_bond, log_investor, log_price, log_amount, log_side, cursor):
+    """
+    Noyau compilé d'une journée de trading sur un marché
+    
+    Met à jour les prix et les volumes en place, puis écrit les transactions générées
+    à partir des tirages aléatoires fournis dans les colonnes du journal, à partir de cursor.
+    investor_draws ne doit contenir que des investisseurs éligibles (budget >= min_amount) :
+    le journal reçoit exactement une transaction par tirage.
+    
+    Returns:
+        int: Position du curseur après la dernière transaction écrite
+    """
+    # Ajustement des prix en fonction des taux d'intérêt et du bruit spécifique
+    for i in range(prices.size):
+        rate_sensitivity = maturities[i] * 0.05  # Sensibilité aux taux (duration simplifiée)
+        price_impact = -rate_sensitivity * (reference_rate - 0.03)
+        prices[i] *= (1 + price_impact) * price_change_factor * (1 + specific_noise[i])
+    
+    for t in range(bond_draws.size):
+        b = bond_draws[t]
+        j = investor_draws[t]
+        
+        # Les investisseurs sont tirés parmi ceux qui peuvent se permettre le minimum
+        # (budget de 10% des actifs >= min_amount) : chaque tirage donne une transaction
+        budget = investor_assets[j] * 0.1
+        max_amount = min(face_values[b] * face_multiple, budget)
+        amount = min(min_amount * (1 + size_draws[t]), max_amount)
+        
+        # Prix de transaction (avec spread)
+        if side_draws[t] < 0.5:  # Achat
+            log_price[cursor] = prices[b] * (1 + spreads[b] / 2)
+            log_side[cursor] = 0
+        else:  # Vente
+            log_price[cursor] = prices[b] * (1 - spreads[b] / 2)
+            log_side[cursor] = 1
+        
+        log_day[cursor] = day
+        log_bond[cursor] = b
+        log_investor[cursor] = j
+        log_amount[cursor] = amount
+        cursor += 1
+        
+        # Mise à jour du volume quotidien
+        volumes[b] += amount
+    
+    return cursor
+
+
+@njit(cache=True)
+def _sentiment_path(shocks):
+    """
+    Trajectoire AR(1) du sentiment de marché, bornée à [-1, 1]
+    
+    Args:
+        shocks: Chocs quotidiens de sentiment (le premier jour est ignoré, le sentiment part de 0)
+    
+    Returns:
+        ndarray: Sentiment de chaque jour
+    """
+    sentiment = np.empty(shocks.size)
+    level = 0.0
+    for day in range(shocks.size):
+        if day > 0:
+            level = 0.8 * level + 0.2 * shocks[day]
+            level = min(max(level, -1.0), 1.0)
+        sentiment[day] = level
+    return sentiment
+
+
+@njit(cache=True, fastmath=True)
+def _welford_moments(prices, start, stop):
+    """
+    Moments des rendements quotidiens prices[start:stop+1], en une passe de Welford
+    
+    Args:
+        prices: Prix moyens quotidiens
+        start: Indice du premier rendement
+        stop: Indice de fin (exclu) des rendements
+    
+    Returns:
+        tuple: (nombre de rendements, moyenne, somme des carrés des écarts M2)
+    """
+    count = 0.0
+    mean = 0.0
+    m2 = 0.0
+    for i in range(start, stop):
+        r = prices[i + 1] / prices[i] - 1.0
+        count += 1.0
+        delta = r - mean
+        mean += delta / count
+        m2 += delta * (r - mean)
+    return count, mean, m2
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _parallel_welford_moments(prices, num_blocks):
+    """
+    Moments des rendements quotidiens par blocs de Welford parallèles, combinés avec
+    la formule de Chan
+    
+    Args:
+        prices: Prix moyens quotidiens
+        num_blocks: Nombre de blocs traités en parallèle
+    
+    Returns:
+        tuple: (nombre de rendements, moyenne, somme des carrés des écarts M2)
+    """
+    n = prices.size - 1
+    counts = np.zeros(num_blocks)
+    means = np.zeros(num_blocks)
+    m2s = np.zeros(num_blocks)
+    for b in prange(num_blocks):
+        counts[b], means[b], m2s[b] = _welford_moments(prices, b * n // num_blocks, (b + 1) * n // num_blocks)
+    
+    # Combinaison des moments partiels des blocs
+    count = counts[0]
+    mean = means[0]
+    m2 = m2s[0]
+    for b in range(1, num_blocks):
+        delta = means[b] - mean
+        total = count + counts[b]
+        mean += delta * counts[b] / total
+        m2 += m2s[b] + delta * delta * count * counts[b] / total
+        count = total
+    return count, mean, m2
+
+
+# Nombre de rendements à partir duquel la volatilité est calculée en parallèle : en deçà,
+# le démarrage du pool de threads de numba coûte plus qu'il ne rapporte (et un pool démarré
+# rend les fork ultérieurs dangereux)
+_PARALLEL_VOLATILITY_MIN_RETURNS = 1 << 20
+
+
+def _annualized_volatility(prices):
+    """
+    Volatilité annualisée (%) des rendements quotidiens
+    
+    Args:
+        prices: Prix moyens quotidiens
+    
+    Returns:
+        float: Écart-type des rendements (ddof=1) annualisé sur 252 jours, en pourcentage
+    """
+    n = prices.size - 1
+    if n < 2:
+        return np.nan
+    if n >= _PARALLEL_VOLATILITY_MIN_RETURNS:
+        _, _, m2 = _parallel_welford_moments(prices, 8)
+    else:
+        _, _, m2 = _welford_moments(prices, 0, n)
+    return np.sqrt(m2 / (n - 1)) * 100.0 * np.sqrt(252.0)
+
+
+def _savefig(fig, path, dpi):
+    """
+    Enregistre une figure en PNG avec une compression rapide (niveau 1)
+    
+    Args:
+        fig: Figure matplotlib
+        path: Chemin du fichier
+        dpi: Résolution du graphique
+    """
+    fig.savefig(path, dpi=dpi, pil_kwargs={'compress_level': 1})
+
+
+# Formateurs précompilés des valeurs du rapport, et format de chaque ligne de _row_stats
+_FORMATTERS = {
+    'int': "{:,.0f}".format,
+    'flt1_sep': "{:,.1f}".format,
+    'flt1': "{:.1f}".format,
+    'flt2': "{:.2f}".format,
+    'pct3': "{:.3f}".format
+}
+_ROW_FORMATS = ['int', 'int', 'flt1_sep', 'int', 'pct3', 'flt1', 'flt2']
+
+
+def _row_stats(metrics_df):
+    """
+    Statistiques récapitulatives d'un marché sous forme de vecteur
+    
+    Args:
+        metrics_df: DataFrame des métriques quotidiennes du marché
+    
+    Returns:
+        ndarray: [transactions totales, volume total, transactions quotidiennes moyennes,
+                  volume quotidien moyen, spread moyen (%), profondeur moyenne,
+                  volatilité annualisée (%)]
+    """
+    columns = metrics_df[['num_transactions', 'total_volume', 'avg_spread', 'market_depth']].to_numpy(dtype=np.float64)
+    sums = columns.sum(axis=0)
+    means = sums / columns.shape[0]
+    return np.array([
+        sums[0],
+        sums[1],
+        means[0],
+        means[1],
+        means[2] * 100,  # En pourcentage
+        means[3],
+        _annualized_volatility(metrics_df['avg_price'].to_numpy())
+    ])
+
+
+@functools.lru_cache(maxsize=None)
+def _pyplot():
+    """
+    Importe matplotlib (backend Agg) et configure le style des graphiques à la première
+    analyse graphique, pour ne pas pénaliser les exécutions sans graphiques
+    
+    Returns:
+        module: matplotlib.pyplot
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    
+    # Configuration du style des graphiques
+    sns.set(style="whitegrid")
+    plt.rcParams['figure.figsize'] = (12, 8)
+    plt.rcParams['font.size'] = 12
+    return plt
+
+
+def _aggregate_by_category(codes, values, num_categories):
+    """
+    Effectif et moyenne des valeurs par catégorie, en une passe de np.bincount
+    
+    Args:
+        codes: Codes entiers des catégories (0 à num_categories - 1)
+        values: Valeurs à moyenner
+        num_categories: Nombre de catégories
+    
+    Returns:
+        tuple: (effectifs, moyennes ; NaN pour une catégorie vide)
+    """
+    counts = np.bincount(codes, minlength=num_categories)
+    sums = np.bincount(codes, weights=values.astype(np.float64), minlength=num_categories)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = sums / counts
+    return counts, means
+
+
+def _rolling_volatility(returns, window):
+    """
+    Volatilité glissante des rendements sur une fenêtre fixe
+    
+    Args:
+        returns: Tableau des rendements quotidiens
+        window: Taille de la fenêtre en jours
+    
+    Returns:
+        ndarray: Volatilité alignée sur les rendements (NaN tant que la fenêtre est incomplète)
+    """
+    volatility = np.full(returns.size, np.nan)
+    if returns.size >= window:
+        windows = np.lib.stride_tricks.sliding_window_view(returns, window)
+        volatility[window - 1:] = windows.std(axis=-1, ddof=1) * np.sqrt(window)
+    return volatility
 
-# Configuration du style des graphiques
-sns.set(style="whitegrid")
-plt.rcParams['figure.figsize'] = (12, 8)
-plt.rcParams['font.size'] = 12
 
 class BondMarketSimulator:
     """
@@ -29,7 +370,7 @@ class BondMarketSimulator:
     """
     
     def __init__(self, num_bonds=100, num_investors=1000, simulation_days=365, 
-                 traditional_min_amount=10000, tokenized_min_amount=100):
+                 traditional_min_amount=10000, tokenized_min_amount=100, seed=None, plot=True, use_processes=False):
         """
         Initialise le simulateur avec les paramètres du marché
         
@@ -39,20 +380,29 @@ class BondMarketSimulator:
             simulation_days: Nombre de jours à simuler
             traditional_min_amount: Montant minimum d'investissement dans les obligations traditionnelles
             tokenized_min_amount: Montant minimum d'investissement dans les obligations tokenisées
+            seed: Graine du générateur aléatoire (None pour une simulation non reproductible)
+            plot: Si False, l'analyse n'affiche aucun graphique et exporte les données au format Parquet
+            use_processes: Si True, simule les deux marchés dans deux processus au lieu de deux threads
+                (lancés en 'spawn' : le script appelant doit être protégé par if __name__ == "__main__")
         """
         self.num_bonds = num_bonds
         self.num_investors = num_investors
         self.simulation_days = simulation_days
         self.traditional_min_amount = traditional_min_amount
         self.tokenized_min_amount = tokenized_min_amount
+        self.plot = plot
+        self.use_processes = use_processes
+        
+        # Générateur aléatoire unique pour toute la simulation
+        self.rng = np.random.default_rng(seed)
         
         # Initialisation des données de simulation
         self.bonds = None
         self.investors = None
         self.traditional_market = None
         self.tokenized_market = None
-        self.traditional_transactions = []
-        self.tokenized_transactions = []
+        self.traditional_transactions = None
+        self.tokenized_transactions = None
         self.results = {}
         
         # Création du répertoire pour les résultats si nécessaire
@@ -63,65 +413,60 @@ class BondMarketSimulator:
         Génère un ensemble d'obligations avec des caractéristiques aléatoires
         """
         # Caractéristiques des obligations
-        face_values = np.random.choice([1000, 5000, 10000, 50000, 100000], self.num_bonds)
-        coupon_rates = np.random.uniform(0.01, 0.08, self.num_bonds)  # 1% à 8%
-        maturities = np.random.choice([1, 2, 3, 5, 7, 10, 15, 20, 30], self.num_bonds)  # en années
-        credit_ratings = np.random.choice(['AAA', 'AA', 'A', 'BBB', 'BB', 'B'], self.num_bonds, 
+        face_values = self.rng.choice([1000, 5000, 10000, 50000, 100000], self.num_bonds)
+        coupon_rates = self.rng.uniform(0.01, 0.08, self.num_bonds)  # 1% à 8%
+        maturities = self.rng.choice([1, 2, 3, 5, 7, 10, 15, 20, 30], self.num_bonds)  # en années
+        rating_scale = ['AAA', 'AA', 'A', 'BBB', 'BB', 'B']
+        credit_ratings = self.rng.choice(rating_scale, self.num_bonds, 
                                         p=[0.05, 0.15, 0.25, 0.30, 0.15, 0.10])
         
-        # Création du DataFrame des obligations
+        # Création du DataFrame des obligations : chaque obligation traditionnelle a son
+        # duplicata tokenisé, construit directement par duplication des colonnes
+        issue_date = pd.Timestamp('2024-01-01')
+        maturity_dates = {years: issue_date + pd.DateOffset(years=int(years)) for years in np.unique(maturities)}
         self.bonds = pd.DataFrame({
-            'bond_id': range(1, self.num_bonds + 1),
-            'face_value': face_values,
-            'coupon_rate': coupon_rates,
-            'maturity_years': maturities,
-            'credit_rating': credit_ratings,
-            'issue_date': pd.Timestamp('2024-01-01'),
-            'is_tokenized': [False] * self.num_bonds
+            'bond_id': np.arange(1, 2 * self.num_bonds + 1, dtype=np.int32),
+            'face_value': np.tile(face_values, 2),
+            'coupon_rate': np.tile(coupon_rates, 2),
+            'maturity_years': np.tile(maturities, 2),
+            'credit_rating': pd.Categorical(np.tile(credit_ratings, 2), categories=rating_scale, ordered=True),
+            'issue_date': issue_date,
+            'is_tokenized': np.repeat([False, True], self.num_bonds)
         })
         
-        # Calcul des dates d'échéance
-        self.bonds['maturity_date'] = self.bonds.apply(
-            lambda x: x['issue_date'] + pd.DateOffset(years=x['maturity_years']), axis=1
-        )
-        
-        # Création d'obligations tokenisées (duplicata avec statut tokenisé)
-        tokenized_bonds = self.bonds.copy()
-        tokenized_bonds['is_tokenized'] = True
-        tokenized_bonds['bond_id'] = tokenized_bonds['bond_id'] + self.num_bonds
+        # Calcul des dates d'échéance (une seule date par maturité distincte)
+        self.bonds['maturity_date'] = self.bonds['maturity_years'].map(maturity_dates)
         
-        # Combinaison des obligations traditionnelles et tokenisées
-        self.bonds = pd.concat([self.bonds, tokenized_bonds], ignore_index=True)
-        
-        print(f"Généré {len(self.bonds)} obligations (dont {len(tokenized_bonds)} tokenisées)")
+        print(f"Généré {len(self.bonds)} obligations (dont {self.num_bonds} tokenisées)")
     
     def generate_investors(self):
         """
         Génère un ensemble d'investisseurs avec différents profils
         """
         # Profils des investisseurs
-        investor_types = np.random.choice(['Retail', 'Institutional', 'Corporate'], self.num_investors, 
+        investor_categories = ['Retail', 'Institutional', 'Corporate']
+        investor_types = self.rng.choice(investor_categories, self.num_investors, 
                                          p=[0.6, 0.3, 0.1])
         
         # Distribution log-normale des actifs pour simuler l'inégalité de richesse
-        assets = np.random.lognormal(mean=10, sigma=2, size=self.num_investors)
+        assets = self.rng.lognormal(mean=10, sigma=2, size=self.num_investors)
         assets = assets * 10000  # Mise à l'échelle
         
         # Préférence pour les technologies blockchain (plus élevée chez les petits investisseurs)
-        blockchain_preference = np.random.beta(2, 5, self.num_investors)
+        blockchain_preference = self.rng.beta(2, 5, self.num_investors)
         
         # Aversion au risque
-        risk_aversion = np.random.normal(0.5, 0.15, self.num_investors)
+        risk_aversion = self.rng.normal(0.5, 0.15, self.num_investors)
         risk_aversion = np.clip(risk_aversion, 0.1, 0.9)  # Limitation entre 0.1 et 0.9
         
         # Horizons d'investissement en années
-        investment_horizons = np.random.choice([1, 2, 3, 5, 7, 10, 15], self.num_investors,
+        investment_horizons = self.rng.choice([1, 2, 3, 5, 7, 10, 15], self.num_investors,
                                               p=[0.15, 0.20, 0.25, 0.15, 0.10, 0.10, 0.05])
         
         # Création du DataFrame des investisseurs
         self.investors = pd.DataFrame({
-            'investor_id': range(1, self.num_investors + 1),
-            'type': investor_types,
+            'investor_id': np.arange(1, self.num_investors + 1, dtype=np.int32),
+            'type': pd.Categorical(investor_types, categories=investor_categories),
             'assets': assets,
             'blockchain_preference': blockchain_preference,
             'risk_aversion': risk_aversion,
@@ -134,37 +479,66 @@ class BondMarketSimulator:
         """
         Initialise les marchés obligataires traditionnels et tokenisés
         """
-        # Sélection des obligations traditionnelles et tokenisées
-        self.traditional_market = self.bonds[self.bonds['is_tokenized'] == False].copy()
-        self.tokenized_market = self.bonds[self.bonds['is_tokenized'] == True].copy()
-        
-        # Initialisation des prix et de la liquidité
-        for market in [self.traditional_market, self.tokenized_market]:
-            # Prix initial = valeur nominale ajustée selon le taux du coupon par rapport à un taux de référence
-            reference_rate = 0.03  # Taux de référence de 3%
-            market['price'] = market.apply(
-                lambda x: x['face_value'] * (1 + (x['coupon_rate'] - reference_rate) * x['maturity_years']), 
-                axis=1
-            )
-            
-            # Volume quotidien initial (plus élevé pour les obligations tokenisées)
-            base_volume = market['face_value'] * 0.01  # 1% de la valeur nominale
-            if market.iloc[0]['is_tokenized']:
-                market['daily_volume'] = base_volume * 5  # 5 fois plus de volume pour les tokenisées
-            else:
-                market['daily_volume'] = base_volume
-            
-            # Spread bid-ask (plus faible pour les obligations tokenisées)
-            if market.iloc[0]['is_tokenized']:
-                market['bid_ask_spread'] = 0.001 + 0.001 * market['maturity_years']  # 0.1% + 0.1% par année de maturité
-            else:
-                market['bid_ask_spread'] = 0.005 + 0.002 * market['maturity_years']  # 0.5% + 0.2% par année de maturité
-            
-            # Profondeur du marché (nombre d'ordres)
-            if market.iloc[0]['is_tokenized']:
-                market['market_depth'] = 50 + np.random.poisson(50, len(market))
-            else:
-                market['market_depth'] = 10 + np.random.poisson(10, len(market))
+        self.traditional_market = self._create_market(is_tokenized=False)
+        self.tokenized_market = self._create_market(is_tokenized=True)
+    
+    def _create_market(self, is_tokenized):
+        """
+        Construit l'état initial d'un marché à partir du DataFrame des obligations
+        
+        Args:
+            is_tokenized: Indique s'il s'agit du marché tokenisé
+        
+        Returns:
+            MarketArrays: État initial du marché
+        """
+        # Sélection des obligations du marché
+        bonds = self.bonds[self.bonds['is_tokenized'] == is_tokenized]
+        face_value = bonds['face_value'].to_numpy(dtype=np.float32)
+        coupon_rate = bonds['coupon_rate'].to_numpy(dtype=np.float32)
+        maturity_years = bonds['maturity_years'].to_numpy(dtype=np.float32)
+        
+        # Paramètres propres au marché : les obligations tokenisées ont plus de volume (x5),
+        # des spreads plus faibles et une profondeur de marché plus importante
+        if is_tokenized:
+            volume_multiplier = 5
+            spread_base, spread_per_year = 0.001, 0.001  # 0.1% + 0.1% par année de maturité
+            depth_base = 50
+        else:
+            volume_multiplier = 1
+            spread_base, spread_per_year = 0.005, 0.002  # 0.5% + 0.2% par année de maturité
+            depth_base = 10
+        
+        # Prix initial = valeur nominale ajustée selon le taux du coupon par rapport à un taux de référence
+        reference_rate = 0.03  # Taux de référence de 3%
+        price = np.subtract(coupon_rate, np.float32(reference_rate))
+        price *= maturity_years
+        price += 1.0
+        price *= face_value
+        
+        # Volume quotidien de base (1% de la valeur nominale)
+        base_volume = face_value * 0.01
+        base_volume *= volume_multiplier
+        
+        # Spread bid-ask
+        bid_ask_spread = np.multiply(maturity_years, np.float32(spread_per_year))
+        bid_ask_spread += spread_base
+        
+        # Profondeur du marché (nombre d'ordres)
+        market_depth = depth_base + self.rng.poisson(depth_base, len(bonds))
+        
+        return MarketArrays(
+            bond_id=bonds['bond_id'].to_numpy(dtype=np.int32),
+            face_value=face_value,
+            coupon_rate=coupon_rate,
+            maturity_years=maturity_years,
+            price=price,
+            base_volume=base_volume,
+            daily_volume=base_volume.copy(),
+            bid_ask_spread=bid_ask_spread,
+            market_depth=market_depth.astype(np.int32),
+            is_tokenized=is_tokenized
+        )
     
     def run_simulation(self):
         """
@@ -178,132 +552,208 @@ class BondMarketSimulator:
         if self.traditional_market is None or self.tokenized_market is None:
             self.initialize_markets()
         
-        # Historique des métriques de marché
-        traditional_metrics = []
-        tokenized_metrics = []
+        # Extraction unique des actifs des investisseurs, lus chaque jour par le noyau de trading
+        self._investor_assets = self.investors['assets'].to_numpy(dtype=np.float64)
+        
+        # Investisseurs pouvant se permettre le montant minimum de chaque marché (10% de leurs actifs)
+        self._eligible_investors = {
+            False: np.flatnonzero(self._investor_assets * 0.1 >= self.traditional_min_amount),
+            True: np.flatnonzero(self._investor_assets * 0.1 >= self.tokenized_min_amount)
+        }
+        
+        # Générateurs indépendants par marché : les deux marchés sont simulés en parallèle
+        self._market_rngs = dict(zip((False, True), self.rng.spawn(2)))
+        
+        # Conditions de marché de toute la période et aléa propre aux obligations, tirés en une fois
+        market_conditions_path = self._generate_market_conditions()
+        traditional_draws = self._draw_market_noise(self.traditional_market)
+        tokenized_draws = self._draw_market_noise(self.tokenized_market)
+        
+        # Les deux marchés sont indépendants (générateurs et tirages propres, conditions de marché
+        # précalculées) : chacun est simulé sur toute la période dans son propre worker, threads
+        # (le noyau compilé libère le GIL) ou processus si use_processes,
+        # lancés en 'spawn' : un fork d'un processus ayant déjà démarré des
+        # threads (numba, TBB) peut bloquer indéfiniment
+        if self.use_processes:
+            executor = ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context('spawn'))
+        else:
+            executor = ThreadPoolExecutor(max_workers=2)
+        with executor:
+            futures = {
+                executor.submit(self._simulate_market, False, market_conditions_path, traditional_draws): False,
+                executor.submit(self._simulate_market, True, market_conditions_path, tokenized_draws): True
+            }
+            results = {futures[future]: future.result() for future in as_completed(futures)}
+        
+        # Récupération de l'état final des marchés (copié par les processus workers)
+        self.traditional_market, self.traditional_transactions, traditional_metrics = results[False]
+        self.tokenized_market, self.tokenized_transactions, tokenized_metrics = results[True]
         
-        # Simulation jour par jour
         start_date = pd.Timestamp('2024-01-01')
         
-        for day in range(self.simulation_days):
-            current_date = start_date + pd.DateOffset(days=day)
-            
-            # Mise à jour des conditions de marché (taux d'intérêt, sentiment, etc.)
-            market_conditions = self._update_market_conditions(day)
+        # Conversion des métriques en DataFrames
+        dates = start_date + pd.to_timedelta(np.arange(self.simulation_days), unit='D')
+        self.traditional_metrics_df = pd.DataFrame({'date': dates, **traditional_metrics})
+        self.tokenized_metrics_df = pd.DataFrame({'date': dates, **tokenized_metrics})
+        
+        # Conversion des journaux de transactions en DataFrames
+        investor_ids = self.investors['investor_id'].to_numpy()
+        self.traditional_transactions_df = self.traditional_transactions.to_frame(
+            self.traditional_market, investor_ids, start_date
+        )
+        self.tokenized_transactions_df = self.tokenized_transactions.to_frame(
+            self.tokenized_market, investor_ids, start_date
+        )
+        
+        print("Simulation terminée")
+    
+    def _simulate_market(self, is_tokenized, market_conditions_path, market_draws):
+        """
+        Simule un marché jour par jour sur toute la période
+        
+        Args:
+            is_tokenized: Indique s'il s'agit du marché tokenisé
+            market_conditions_path: Séries quotidiennes des conditions de marché
+            market_draws: Matrices (jours, obligations) de l'aléa propre au marché
             
-            # Simulation du marché traditionnel
-            traditional_daily_metrics, traditional_daily_trades = self._simulate_daily_trading(
-                self.traditional_market, 
-                current_date, 
-                market_conditions, 
-                is_tokenized=False
-            )
-            traditional_metrics.append(traditional_daily_metrics)
-            self.traditional_transactions.extend(traditional_daily_trades)
+        Returns:
+            tuple: (état final du marché, journal des transactions, métriques quotidiennes)
+        """
+        market = self.tokenized_market if is_tokenized else self.traditional_market
+        
+        # Journal des transactions, dimensionné pour le pire cas (au plus 5 transactions
+        # par obligation et par jour sur le marché tokenisé, 2 sur le marché traditionnel)
+        max_daily_per_bond = 5 if is_tokenized else 2
+        transactions = TransactionLog.allocate(self.simulation_days * max(1, max_daily_per_bond * len(market)))
+        
+        # Historique des métriques de marché, une colonne préallouée par métrique
+        metrics = self._allocate_metrics()
+        
+        label = 'tokenisé' if is_tokenized else 'traditionnel'
+        for day in range(self.simulation_days):
+            # Conditions de marché du jour (taux d'intérêt, sentiment, etc.)
+            market_conditions = {name: values[day] for name, values in market_conditions_path.items()}
             
-            # Simulation du marché tokenisé
-            tokenized_daily_metrics, tokenized_daily_trades = self._simulate_daily_trading(
-                self.tokenized_market, 
-                current_date, 
-                market_conditions, 
-                is_tokenized=True
+            self._simulate_daily_trading(
+                market,
+                transactions,
+                metrics,
+                day,
+                market_conditions,
+                {name: draws[day] for name, draws in market_draws.items()},
+                is_tokenized=is_tokenized
             )
-            tokenized_metrics.append(tokenized_daily_metrics)
-            self.tokenized_transactions.extend(tokenized_daily_trades)
             
-            # Affichage de la progression
+            # Affichage de la progression, en une seule écriture pour que les lignes des deux
+            # marchés simulés en parallèle ne s'entremêlent pas
             if (day + 1) % 30 == 0:
-                print(f"Simulation: {day + 1}/{self.simulation_days} jours complétés")
+                sys.stdout.write(f"Simulation (marché {label}): {day + 1}/{self.simulation_days} jours complétés\n")
         
-        # Conversion des métriques en DataFrames
-        self.traditional_metrics_df = pd.DataFrame(traditional_metrics)
-        self.tokenized_metrics_df = pd.DataFrame(tokenized_metrics)
-        
-        # Conversion des transactions en DataFrames
-        self.traditional_transactions_df = pd.DataFrame(self.traditional_transactions)
-        self.tokenized_transactions_df = pd.DataFrame(self.tokenized_transactions)
+        return market, transactions, metrics
+    
+    def _allocate_metrics(self):
+        """
+        Préalloue les colonnes des métriques quotidiennes d'un marché
         
-        print("Simulation terminée")
+        Returns:
+            dict: Tableau par métrique, indexé par jour
+        """
+        days = self.simulation_days
+        return {
+            'avg_price': np.empty(days),
+            'total_volume': np.empty(days),
+            'avg_spread': np.empty(days),
+            'num_transactions': np.empty(days, np.int64),
+            'market_depth': np.empty(days)
+        }
     
-    def _update_market_conditions(self, day):
+    def _draw_market_noise(self, market):
         """
-        Met à jour les conditions de marché pour le jour spécifié
+        Tire en une seule fois l'aléa quotidien propre à chaque obligation d'un marché
         
         Args:
-            day: Jour de la simulation
+            market: État du marché
         
         Returns:
-            dict: Conditions de marché pour le jour
+            dict: Matrices (jours, obligations) de tirages
         """
+        shape = (self.simulation_days, len(market))
+        
+        # Tirages en float32, comme l'état du marché ; les ajustements N(1, sigma) sont
+        # obtenus en place à partir de la loi normale centrée réduite
+        spread_adjustment = self.rng.standard_normal(shape, dtype=np.float32)
+        spread_adjustment *= 0.05
+        spread_adjustment += 1
+        depth_adjustment = self.rng.standard_normal(shape, dtype=np.float32)
+        depth_adjustment *= 0.1
+        depth_adjustment += 1
+        
+        return {
+            'specific_noise': self.rng.standard_normal(shape, dtype=np.float32),  # Mis à l'échelle par la volatilité du jour
+            'spread_adjustment': spread_adjustment,
+            'depth_adjustment': depth_adjustment
+        }
+    
+    def _generate_market_conditions(self):
+        """
+        Génère les conditions de marché de toute la simulation en une seule fois
+        
+        Returns:
+            dict: Séries quotidiennes (tableaux indexés par jour) des conditions de marché
+        """
+        days = self.simulation_days
+        
+        # Tirage en une fois de l'aléa des conditions de marché
+        rate_noise = self.rng.normal(0, 0.0005, days)  # Bruit quotidien
+        sentiment_noise = self.rng.normal(0, 0.1, days)
+        event_hits = self.rng.random(days) < 0.01  # 1% de chance d'un événement significatif par jour
+        event_magnitudes = self.rng.normal(0, 0.03, days)
+        
         # Taux d'intérêt de référence (légère tendance à la hausse sur l'année)
         base_rate = 0.03
-        rate_trend = day / self.simulation_days * 0.01  # +1% sur l'année
-        daily_noise = np.random.normal(0, 0.0005)  # Bruit quotidien
-        reference_rate = base_rate + rate_trend + daily_noise
+        rate_trend = np.arange(days) / days * 0.01  # +1% sur l'année
+        reference_rate = base_rate + rate_trend + rate_noise
         
-        # Sentiment du marché (-1 à 1)
-        if day == 0:
-            self.market_sentiment = 0
-        else:
-            # Le sentiment évolue avec une certaine autocorrélation
-            sentiment_change = np.random.normal(0, 0.1)
-            self.market_sentiment = 0.8 * self.market_sentiment + 0.2 * sentiment_change
-            self.market_sentiment = np.clip(self.market_sentiment, -1, 1)
+        # Sentiment du marché (-1 à 1), qui évolue avec une certaine autocorrélation
+        market_sentiment = _sentiment_path(sentiment_noise)
         
         # Volatilité du marché
         base_volatility = 0.01
-        volatility = base_volatility * (1 + 0.5 * abs(self.market_sentiment))
+        volatility = base_volatility * (1 + 0.5 * np.abs(market_sentiment))
         
         # Événements aléatoires (crises, nouvelles, etc.)
-        event_probability = 0.01  # 1% de chance d'un événement significatif par jour
-        event_impact = 0
-        if np.random.random() < event_probability:
-            event_impact = np.random.normal(0, 0.03)  # Impact de l'événement
+        event_impact = np.where(event_hits, event_magnitudes, 0.0)
         
         return {
             'reference_rate': reference_rate,
-            'market_sentiment': self.market_sentiment,
+            'market_sentiment': market_sentiment,
             'volatility': volatility,
             'event_impact': event_impact
         }
     
-    def _simulate_daily_trading(self, market, current_date, market_conditions, is_tokenized):
+    def _simulate_daily_trading(self, market, transactions, metrics, day, market_conditions,
+                                daily_draws, is_tokenized):
         """
         Simule les activités de trading pour un jour spécifique
         
         Args:
-            market: DataFrame du marché (traditionnel ou tokenisé)
-            current_date: Date actuelle de la simulation
+            market: État du marché (traditionnel ou tokenisé), mis à jour en place
+            transactions: Journal des transactions du marché, complété en place
+            metrics: Colonnes des métriques quotidiennes du marché, complétées en place
+            day: Jour de la simulation
             market_conditions: Conditions de marché du jour
+            daily_draws: Tirages aléatoires du jour propres aux obligations du marché
             is_tokenized: Indique s'il s'agit du marché tokenisé
-        
-        Returns:
-            tuple: (métriques quotidiennes, transactions du jour)
         """
-        # Copie du marché pour la mise à jour
-        updated_market = market.copy()
-        
         # Ajustement des prix en fonction des conditions de marché
         price_change_factor = 1 + market_conditions['event_impact']
         price_change_factor += market_conditions['market_sentiment'] * 0.01
         
-        # Ajustement des prix en fonction des taux d'intérêt
-        for idx, bond in updated_market.iterrows():
-            rate_sensitivity = bond['maturity_years'] * 0.05  # Sensibilité aux taux (duration simplifiée)
-            price_impact = -rate_sensitivity * (market_conditions['reference_rate'] - 0.03)
-            
-            # Prix mis à jour
-            updated_market.at[idx, 'price'] = bond['price'] * (1 + price_impact) * price_change_factor
-            
-            # Ajout d'un bruit spécifique à l'obligation
-            specific_noise = np.random.normal(0, market_conditions['volatility'])
-            updated_market.at[idx, 'price'] *= (1 + specific_noise)
-        
-        # Générer les transactions du jour
-        daily_transactions = []
+        # Bruit spécifique à chaque obligation
+        specific_noise = daily_draws['specific_noise'] * np.float32(market_conditions['volatility'])
         
         # Nombre de transactions (plus élevé pour le marché tokenisé)
-        base_transactions = len(updated_market) * 2
+        base_transactions = len(market) * 2
         if is_tokenized:
             num_transactions = int(base_transactions * (1.5 + market_conditions['market_sentiment']))
         else:
@@ -312,102 +762,76 @@ class BondMarketSimulator:
         # Minimum 1 transaction
         num_transactions = max(1, num_transactions)
         
-        # Générer les transactions
-        for _ in range(num_transactions):
-            # Sélection aléatoire d'une obligation
-            bond_idx = np.random.randint(0, len(updated_market))
-            bond = updated_market.iloc[bond_idx]
-            
-            # Sélection aléatoire d'un investisseur
-            investor_idx = np.random.randint(0, len(self.investors))
-            investor = self.investors.iloc[investor_idx]
-            
-            # Montant de la transaction (dépend du type de marché)
-            if is_tokenized:
-                # Pour les obligations tokenisées, peut être une fraction de la valeur nominale
-                min_amount = self.tokenized_min_amount
-                max_amount = min(bond['face_value'], investor['assets'] * 0.1)
-            else:
-                # Pour les obligations traditionnelles, généralement par multiple de la valeur nominale
-                min_amount = self.traditional_min_amount
-                max_amount = min(bond['face_value'] * 5, investor['assets'] * 0.1)
-            
-            # Si l'investisseur ne peut pas se permettre le minimum, passer à un autre
-            if min_amount > investor['assets'] * 0.1:
-                continue
-            
-            transaction_amount = min_amount * (1 + np.random.exponential(2))
-            transaction_amount = min(transaction_amount, max_amount)
-            
-            # Prix de transaction (avec spread)
-            spread = bond['bid_ask_spread']
-            if np.random.random() < 0.5:  # Achat
-                transaction_price = bond['price'] * (1 + spread/2)
-                transaction_type = 'buy'
-            else:  # Vente
-                transaction_price = bond['price'] * (1 - spread/2)
-                transaction_type = 'sell'
-            
-            # Enregistrement de la transaction
-            transaction = {
-                'date': current_date,
-                'bond_id': bond['bond_id'],
-                'investor_id': investor['investor_id'],
-                'price': transaction_price,
-                'amount': transaction_amount,
-                'type': transaction_type,
-                'is_tokenized': is_tokenized
-            }
-            daily_transactions.append(transaction)
-            
-            # Mise à jour du volume quotidien
-            updated_market.at[bond_idx, 'daily_volume'] += transaction_amount
+        # Seules les transactions proposées à un investisseur pouvant se permettre le minimum
+        # ont lieu : leur nombre suit une loi binomiale, et ces investisseurs sont tirés
+        # directement parmi les éligibles
+        rng = self._market_rngs[is_tokenized]
+        eligible = self._eligible_investors[is_tokenized]
+        num_transactions = rng.binomial(num_transactions, len(eligible) / len(self._investor_assets))
+        
+        # Tirages aléatoires de toutes les transactions du jour en une seule fois
+        bond_draws = rng.integers(0, len(market), num_transactions)
+        investor_draws = rng.choice(eligible, num_transactions)
+        side_draws = rng.random(num_transactions)
+        size_draws = rng.exponential(2, num_transactions)
+        
+        # Montant de la transaction (dépend du type de marché)
+        if is_tokenized:
+            # Pour les obligations tokenisées, peut être une fraction de la valeur nominale
+            min_amount = self.tokenized_min_amount
+            face_multiple = 1
+        else:
+            # Pour les obligations traditionnelles, généralement par multiple de la valeur nominale
+            min_amount = self.traditional_min_amount
+            face_multiple = 5
+        
+        # Mise à jour des prix et génération des transactions dans le journal (noyau compilé)
+        start = transactions.size
+        transactions.size = _simulate_day_kernel(
+            market.price, market.daily_volume, market.bid_ask_spread, market.maturity_years,
+            market.face_value, self._investor_assets,
+            market_conditions['reference_rate'], price_change_factor, specific_noise,
+            bond_draws, investor_draws, side_draws, size_draws,
+            float(min_amount), float(face_multiple), day,
+            transactions.day, transactions.bond_idx, transactions.investor_idx,
+            transactions.price, transactions.amount, transactions.side, start
+        )
         
         # Calcul des métriques quotidiennes
-        daily_metrics = {
-            'date': current_date,
-            'avg_price': updated_market['price'].mean(),
-            'total_volume': updated_market['daily_volume'].sum(),
-            'avg_spread': updated_market['bid_ask_spread'].mean(),
-            'num_transactions': len(daily_transactions),
-            'market_depth': updated_market['market_depth'].mean()
-        }
+        metrics['avg_price'][day] = market.price.mean(dtype=np.float64)
+        metrics['total_volume'][day] = market.daily_volume.sum(dtype=np.float64)
+        metrics['avg_spread'][day] = market.bid_ask_spread.mean(dtype=np.float64)
+        metrics['num_transactions'][day] = transactions.size - start
+        metrics['market_depth'][day] = market.market_depth.mean()
         
         # Mise à jour du marché pour le jour suivant
-        self._update_market_for_next_day(market, updated_market)
-        
-        return daily_metrics, daily_transactions
+        self._update_market_for_next_day(market, daily_draws)
     
-    def _update_market_for_next_day(self, original_market, updated_market):
+    def _update_market_for_next_day(self, market, daily_draws):
         """
         Met à jour le marché pour le jour suivant
         
         Args:
-            original_market: Référence au marché original
-            updated_market: Marché mis à jour
+            market: État du marché, mis à jour en place
+            daily_draws: Tirages aléatoires du jour propres aux obligations du marché
         """
-        # Mise à jour des prix et des volumes
-        original_market['price'] = updated_market['price']
-        
         # Réinitialisation du volume quotidien (mais garde une mémoire du volume précédent)
-        base_volume = original_market['face_value'] * 0.01
-        if original_market.iloc[0]['is_tokenized']:
-            original_market['daily_volume'] = base_volume * 5 * 0.2 + updated_market['daily_volume'] * 0.8
-        else:
-            original_market['daily_volume'] = base_volume * 0.2 + updated_market['daily_volume'] * 0.8
+        market.daily_volume *= 0.8
+        market.daily_volume += market.base_volume * np.float32(0.2)
         
         # Mise à jour des spreads (ils varient légèrement avec le temps)
-        spread_adjustment = np.random.normal(1, 0.05, len(original_market))
-        original_market['bid_ask_spread'] = updated_market['bid_ask_spread'] * spread_adjustment
+        market.bid_ask_spread *= daily_draws['spread_adjustment']
         
-        # Mise à jour de la profondeur du marché
-        depth_adjustment = np.random.normal(1, 0.1, len(original_market))
-        original_market['market_depth'] = updated_market['market_depth'] * depth_adjustment
-        original_market['market_depth'] = original_market['market_depth'].astype(int)
+        # Mise à jour de la profondeur du marché (nombre entier d'ordres, tronqué vers zéro)
+        np.multiply(market.market_depth, daily_draws['depth_adjustment'], out=market.market_depth,
+                    casting='unsafe')
     
-    def analyze_results(self):
+    def analyze_results(self, plot_dpi=100):
         """
         Analyse les résultats de la simulation et produit des graphiques
+        
+        Args:
+            plot_dpi: Résolution des graphiques (300 pour une qualité publication)
         """
         if not hasattr(self, 'traditional_metrics_df') or not hasattr(self, 'tokenized_metrics_df'):
             print("Exécutez d'abord la simulation avec run_simulation()")
@@ -419,36 +843,97 @@ class BondMarketSimulator:
         results_dir = "results"
         os.makedirs(results_dir, exist_ok=True)
         
-        # Analyse de la liquidité
-        self._analyze_liquidity(results_dir)
-        
-        # Analyse des spreads bid-ask
-        self._analyze_spreads(results_dir)
-        
-        # Analyse du volume de transactions
-        self._analyze_volumes(results_dir)
-        
-        # Analyse de la distribution des investisseurs
-        self._analyze_investor_distribution(results_dir)
-        
-        # Analyse de la volatilité des prix
-        self._analyze_price_volatility(results_dir)
-        
-        # Analyse des coûts de transaction
-        self._analyze_transaction_costs(results_dir)
+        if self.plot:
+            # Séries dérivées partagées par les analyses, extraites une seule fois par marché
+            series = self._derive_market_series()
+            
+            # Analyse de la liquidité
+            self._analyze_liquidity(results_dir, plot_dpi=plot_dpi)
+            
+            # Analyse des spreads bid-ask
+            self._analyze_spreads(results_dir, plot_dpi=plot_dpi)
+            
+            # Analyse du volume de transactions
+            self._analyze_volumes(results_dir, plot_dpi=plot_dpi)
+            
+            # Analyse de la distribution des investisseurs
+            self._analyze_investor_distribution(results_dir, plot_dpi=plot_dpi)
+            
+            # Analyse de la volatilité des prix
+            self._analyze_price_volatility(results_dir, series, plot_dpi=plot_dpi)
+            
+            # Analyse des coûts de transaction
+            self._analyze_transaction_costs(results_dir, series, plot_dpi=plot_dpi)
+        else:
+            # Export des données brutes pour une analyse ultérieure (sans graphiques)
+            self._export_parquet(results_dir)
         
         # Résumé des statistiques
         self._generate_summary_statistics(results_dir)
         
         print(f"Analyse terminée. Les résultats sont disponibles dans le répertoire '{results_dir}'")
     
-    def _analyze_liquidity(self, results_dir):
+    def _derive_market_series(self):
+        """
+        Calcule les séries dérivées des deux marchés
+        
+        Returns:
+            dict: Séries de chaque marché (voir _derive_series), indexées par is_tokenized
+        """
+        return {
+            False: self._derive_series(self.traditional_metrics_df),
+            True: self._derive_series(self.tokenized_metrics_df)
+        }
+    
+    def _derive_series(self, metrics_df):
+        """
+        Calcule les rendements et les coûts de transaction quotidiens d'un marché
+        
+        Args:
+            metrics_df: DataFrame des métriques quotidiennes du marché
+            
+        Returns:
+            dict: Tableaux NumPy des rendements, des coûts quotidiens et des coûts cumulés
+        """
+        prices = metrics_df['avg_price'].to_numpy()
+        # Approximation simple des coûts basée sur les spreads
+        costs = np.multiply(metrics_df['avg_spread'].to_numpy(), metrics_df['total_volume'].to_numpy())
+        return {
+            'returns': np.diff(prices) / prices[:-1],
+            'costs': costs,
+            'cum_costs': np.cumsum(costs)
+        }
+    
+    def _export_parquet(self, results_dir):
+        """
+        Exporte les transactions au format Parquet (les métriques quotidiennes sont
+        exportées par _generate_summary_statistics)
+        
+        Args:
+            results_dir: Répertoire pour les résultats
+        """
+        outputs = {
+            'traditional_transactions': self.traditional_transactions_df,
+            'tokenized_transactions': self.tokenized_transactions_df
+        }
+        for name, df in outputs.items():
+            df.to_parquet(os.path.join(results_dir, f'{name}.parquet'), engine='pyarrow',
+                          compression='zstd', index=False)
+    
+    def _analyze_liquidity(self, results_dir, plot_dpi=100):
         """
         Analyse la liquidité des marchés
         
         Args:
             results_dir: Répertoire pour les résultats
+            plot_dpi: Résolution des graphiques
         """
+        plt = _pyplot()
+        
+        # Chemins des fichiers produits
+        liquidity_analysis_path = os.path.join(results_dir, 'liquidity_analysis.png')
+        liquidity_ratio_path = os.path.join(results_dir, 'liquidity_ratio.png')
+        
         plt.figure(figsize=(12, 8))
         
         # Nombre de transactions quotidiennes
@@ -476,7 +961,7 @@ class BondMarketSimulator:
         plt.grid(True)
         
         plt.tight_layout()
-        plt.savefig(os.path.join(results_dir, 'liquidity_analysis.png'), dpi=300)
+        _savefig(plt.gcf(), liquidity_analysis_path, plot_dpi)
         plt.close()
         
         # Ratio de liquidité (nombre de transactions / valeur totale)
@@ -494,16 +979,24 @@ class BondMarketSimulator:
         plt.legend()
         plt.grid(True)
         
-        plt.savefig(os.path.join(results_dir, 'liquidity_ratio.png'), dpi=300)
+        _savefig(plt.gcf(), liquidity_ratio_path, plot_dpi)
         plt.close()
     
-    def _analyze_spreads(self, results_dir):
+    def _analyze_spreads(self, results_dir, plot_dpi=100):
         """
         Analyse les spreads bid-ask
         
         Args:
             results_dir: Répertoire pour les résultats
+            plot_dpi: Résolution des graphiques
         """
+        plt = _pyplot()
+        import seaborn as sns
+        
+        # Chemins des fichiers produits
+        spread_analysis_path = os.path.join(results_dir, 'spread_analysis.png')
+        spread_distribution_path = os.path.join(results_dir, 'spread_distribution.png')
+        
         plt.figure(figsize=(10, 6))
         
         # Évolution des spreads bid-ask moyens
@@ -517,7 +1010,7 @@ class BondMarketSimulator:
         plt.legend()
         plt.grid(True)
         
-        plt.savefig(os.path.join(results_dir, 'spread_analysis.png'), dpi=300)
+        _savefig(plt.gcf(), spread_analysis_path, plot_dpi)
         plt.close()
         
         # Distribution des spreads
@@ -536,16 +1029,23 @@ class BondMarketSimulator:
         plt.ylabel('Fréquence')
         
         plt.tight_layout()
-        plt.savefig(os.path.join(results_dir, 'spread_distribution.png'), dpi=300)
+        _savefig(plt.gcf(), spread_distribution_path, plot_dpi)
         plt.close()
     
-    def _analyze_volumes(self, results_dir):
+    def _analyze_volumes(self, results_dir, plot_dpi=100):
         """
         Analyse les volumes de transactions
         
         Args:
             results_dir: Répertoire pour les résultats
+            plot_dpi: Résolution des graphiques
         """
+        plt = _pyplot()
+        
+        # Chemins des fichiers produits
+        volume_analysis_path = os.path.join(results_dir, 'volume_analysis.png')
+        cumulative_volume_path = os.path.join(results_dir, 'cumulative_volume.png')
+        
         plt.figure(figsize=(10, 6))
         
         # Évolution du volume total quotidien
@@ -559,7 +1059,7 @@ class BondMarketSimulator:
         plt.legend()
         plt.grid(True)
         
-        plt.savefig(os.path.join(results_dir, 'volume_analysis.png'), dpi=300)
+        _savefig(plt.gcf(), volume_analysis_path, plot_dpi)
         plt.close()
         
         # Comparer les volumes cumulés
@@ -577,41 +1077,50 @@ class BondMarketSimulator:
         plt.legend()
         plt.grid(True)
         
-        plt.savefig(os.path.join(results_dir, 'cumulative_volume.png'), dpi=300)
+        _savefig(plt.gcf(), cumulative_volume_path, plot_dpi)
         plt.close()
     
-    def _analyze_investor_distribution(self, results_dir):
+    def _analyze_investor_distribution(self, results_dir, plot_dpi=100):
         """
         Analyse la distribution des investisseurs
         
         Args:
             results_dir: Répertoire pour les résultats
+            plot_dpi: Résolution des graphiques
         """
-        # Créer les DataFrames des transactions
-        if not hasattr(self, 'traditional_transactions_df'):
-            self.traditional_transactions_df = pd.DataFrame(self.traditional_transactions)
-        if not hasattr(self, 'tokenized_transactions_df'):
-            self.tokenized_transactions_df = pd.DataFrame(self.tokenized_transactions)
-        
-        # Fusionner avec les informations des investisseurs
-        trad_investors = self.traditional_transactions_df.merge(
-            self.investors, left_on='investor_id', right_on='investor_id'
+        plt = _pyplot()
+        import seaborn as sns
+        
+        # Chemins des fichiers produits
+        investor_distribution_path = os.path.join(results_dir, 'investor_distribution.png')
+        transaction_amount_by_type_path = os.path.join(results_dir, 'transaction_amount_by_type.png')
+        
+        # Informations des investisseurs associées à chaque transaction ('type' désigne le type
+        # d'investisseur) : les identifiants étant la plage dense 1..N, la jointure est un simple
+        # accès par position
+        trad_investors = self._investor_info(self.traditional_transactions_df)
+        token_investors = self._investor_info(self.tokenized_transactions_df)
+        
+        # Nombre de transactions et montant moyen par type d'investisseur
+        investor_types = self.investors['type'].cat.categories
+        trad_counts, trad_mean_amounts = _aggregate_by_category(
+            trad_investors['type'].cat.codes.to_numpy(), trad_investors['amount'].to_numpy(), len(investor_types)
         )
-        token_investors = self.tokenized_transactions_df.merge(
-            self.investors, left_on='investor_id', right_on='investor_id'
+        token_counts, token_mean_amounts = _aggregate_by_category(
+            token_investors['type'].cat.codes.to_numpy(), token_investors['amount'].to_numpy(), len(investor_types)
         )
         
         # Distribution des types d'investisseurs
         plt.figure(figsize=(12, 8))
         
         plt.subplot(2, 2, 1)
-        sns.countplot(x='type', data=trad_investors, palette='Blues')
+        plt.bar(investor_types, trad_counts, color=sns.color_palette('Blues', len(investor_types)))
         plt.title('Types d\'investisseurs - Marché traditionnel')
         plt.xlabel('Type d\'investisseur')
         plt.ylabel('Nombre de transactions')
         
         plt.subplot(2, 2, 2)
-        sns.countplot(x='type', data=token_investors, palette='Greens')
+        plt.bar(investor_types, token_counts, color=sns.color_palette('Greens', len(investor_types)))
         plt.title('Types d\'investisseurs - Marché tokenisé')
         plt.xlabel('Type d\'investisseur')
         plt.ylabel('Nombre de transactions')
@@ -630,48 +1139,77 @@ class BondMarketSimulator:
         plt.ylabel('Fréquence')
         
         plt.tight_layout()
-        plt.savefig(os.path.join(results_dir, 'investor_distribution.png'), dpi=300)
+        _savefig(plt.gcf(), investor_distribution_path, plot_dpi)
         plt.close()
         
         # Montant moyen des transactions par type d'investisseur
         plt.figure(figsize=(12, 6))
         
         plt.subplot(1, 2, 1)
-        sns.barplot(x='type', y='amount', data=trad_investors, estimator=np.mean, palette='Blues')
+        plt.bar(investor_types, trad_mean_amounts, color=sns.color_palette('Blues', len(investor_types)))
         plt.title('Montant moyen des transactions - Marché traditionnel')
         plt.xlabel('Type d\'investisseur')
         plt.ylabel('Montant moyen')
         
         plt.subplot(1, 2, 2)
-        sns.barplot(x='type', y='amount', data=token_investors, estimator=np.mean, palette='Greens')
+        plt.bar(investor_types, token_mean_amounts, color=sns.color_palette('Greens', len(investor_types)))
         plt.title('Montant moyen des transactions - Marché tokenisé')
         plt.xlabel('Type d\'investisseur')
         plt.ylabel('Montant moyen')
         
         plt.tight_layout()
-        plt.savefig(os.path.join(results_dir, 'transaction_amount_by_type.png'), dpi=300)
+        _savefig(plt.gcf(), transaction_amount_by_type_path, plot_dpi)
         plt.close()
     
-    def _analyze_price_volatility(self, results_dir):
+    def _investor_info(self, transactions_df):
+        """
+        Associe à chaque transaction le type et les actifs de son investisseur
+        
+        Args:
+            transactions_df: DataFrame des transactions d'un marché
+        
+        Returns:
+            DataFrame: Type d'investisseur, actifs et montant de chaque transaction
+        """
+        positions = transactions_df['investor_id'].to_numpy() - 1
+        return pd.DataFrame({
+            'type': self.investors['type'].array.take(positions),
+            'assets': self.investors['assets'].to_numpy()[positions],
+            'amount': transactions_df['amount'].to_numpy()
+        })
+    
+    def _analyze_price_volatility(self, results_dir, series=None, plot_dpi=100):
         """
         Analyse la volatilité des prix
         
         Args:
             results_dir: Répertoire pour les résultats
+            series: Séries dérivées des deux marchés (calculées si non fournies)
+            plot_dpi: Résolution des graphiques
         """
+        if series is None:
+            series = self._derive_market_series()
+        
+        plt = _pyplot()
+        import seaborn as sns
+        
+        # Chemins des fichiers produits
+        price_volatility_path = os.path.join(results_dir, 'price_volatility.png')
+        return_distribution_path = os.path.join(results_dir, 'return_distribution.png')
+        
         # Calcul des rendements quotidiens
-        traditional_returns = self.traditional_metrics_df['avg_price'].pct_change().dropna()
-        tokenized_returns = self.tokenized_metrics_df['avg_price'].pct_change().dropna()
+        traditional_returns = series[False]['returns']
+        tokenized_returns = series[True]['returns']
         
         # Volatilité glissante (fenêtre de 30 jours)
         window = 30
-        traditional_volatility = traditional_returns.rolling(window=window).std() * np.sqrt(window)
-        tokenized_volatility = tokenized_returns.rolling(window=window).std() * np.sqrt(window)
+        traditional_volatility = _rolling_volatility(traditional_returns, window)
+        tokenized_volatility = _rolling_volatility(tokenized_returns, window)
         
         plt.figure(figsize=(10, 6))
-        plt.plot(self.traditional_metrics_df['date'].iloc[window:], traditional_volatility.iloc[window-1:], 
+        plt.plot(self.traditional_metrics_df['date'].iloc[window:], traditional_volatility[window-1:], 
                 label='Marché traditionnel', color='blue')
-        plt.plot(self.tokenized_metrics_df['date'].iloc[window:], tokenized_volatility.iloc[window-1:], 
+        plt.plot(self.tokenized_metrics_df['date'].iloc[window:], tokenized_volatility[window-1:], 
                 label='Marché tokenisé', color='green')
         plt.title(f'Volatilité glissante des prix (fenêtre de {window} jours)')
         plt.xlabel('Date')
@@ -679,70 +1217,81 @@ class BondMarketSimulator:
         plt.legend()
         plt.grid(True)
         
-        plt.savefig(os.path.join(results_dir, 'price_volatility.png'), dpi=300)
+        _savefig(plt.gcf(), price_volatility_path, plot_dpi)
         plt.close()
         
-        # Distribution des rendements
-        plt.figure(figsize=(12, 6))
+        # Distribution des rendements, sur des classes et des axes communs aux deux marchés
+        traditional_returns_pct = traditional_returns * 100
+        tokenized_returns_pct = tokenized_returns * 100
+        bins = np.histogram_bin_edges(np.concatenate([traditional_returns_pct, tokenized_returns_pct]), bins='auto')
         
-        plt.subplot(1, 2, 1)
-        sns.histplot(traditional_returns * 100, kde=True, color='blue')
-        plt.title('Distribution des rendements quotidiens - Marché traditionnel')
-        plt.xlabel('Rendement quotidien (%)')
-        plt.ylabel('Fréquence')
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 6), sharex=True, sharey=True)
         
-        plt.subplot(1, 2, 2)
-        sns.histplot(tokenized_returns * 100, kde=True, color='green')
-        plt.title('Distribution des rendements quotidiens - Marché tokenisé')
-        plt.xlabel('Rendement quotidien (%)')
-        plt.ylabel('Fréquence')
+        sns.histplot(traditional_returns_pct, bins=bins, kde=False, color='blue', ax=ax1)
+        ax1.set_title('Distribution des rendements quotidiens - Marché traditionnel')
+        ax1.set_xlabel('Rendement quotidien (%)')
+        ax1.set_ylabel('Fréquence')
         
-        plt.tight_layout()
-        plt.savefig(os.path.join(results_dir, 'return_distribution.png'), dpi=300)
-        plt.close()
+        sns.histplot(tokenized_returns_pct, bins=bins, kde=False, color='green', ax=ax2)
+        ax2.set_title('Distribution des rendements quotidiens - Marché tokenisé')
+        ax2.set_xlabel('Rendement quotidien (%)')
+        ax2.set_ylabel('Fréquence')
+        
+        fig.tight_layout()
+        _savefig(fig, return_distribution_path, plot_dpi)
+        plt.close(fig)
     
-    def _analyze_transaction_costs(self, results_dir):
+    def _analyze_transaction_costs(self, results_dir, series=None, plot_dpi=100):
         """
         Analyse les coûts de transaction
         
         Args:
             results_dir: Répertoire pour les résultats
+            series: Séries dérivées des deux marchés (calculées si non fournies)
+            plot_dpi: Résolution des graphiques
         """
-        # Calcul des coûts de transaction (approximation simple basée sur les spreads)
-        traditional_costs = self.traditional_metrics_df['avg_spread'] * self.traditional_metrics_df['total_volume']
-        tokenized_costs = self.tokenized_metrics_df['avg_spread'] * self.tokenized_metrics_df['total_volume']
+        if series is None:
+            series = self._derive_market_series()
         
-        plt.figure(figsize=(10, 6))
-        plt.plot(self.traditional_metrics_df['date'], traditional_costs / 1e3, 
-                label='Marché traditionnel', color='blue')
-        plt.plot(self.tokenized_metrics_df['date'], tokenized_costs / 1e3, 
-                label='Marché tokenisé', color='green')
-        plt.title('Coûts de transaction quotidiens')
-        plt.xlabel('Date')
-        plt.ylabel('Coûts de transaction (milliers)')
-        plt.legend()
-        plt.grid(True)
+        plt = _pyplot()
         
-        plt.savefig(os.path.join(results_dir, 'transaction_costs.png'), dpi=300)
-        plt.close()
+        # Chemins des fichiers produits
+        transaction_costs_path = os.path.join(results_dir, 'transaction_costs.png')
+        
+        # Calcul des coûts de transaction (approximation simple basée sur les spreads)
+        traditional_costs = series[False]['costs']
+        tokenized_costs = series[True]['costs']
         
         # Coûts cumulés
-        trad_cum_costs = traditional_costs.cumsum()
-        token_cum_costs = tokenized_costs.cumsum()
+        trad_cum_costs = series[False]['cum_costs']
+        token_cum_costs = series[True]['cum_costs']
         
-        plt.figure(figsize=(10, 6))
-        plt.plot(self.traditional_metrics_df['date'], trad_cum_costs / 1e6, 
+        # Coûts quotidiens et cumulés sur une seule figure à deux panneaux
+        fig, axes = plt.subplots(2, 1, figsize=(10, 10))
+        
+        axes[0].plot(self.traditional_metrics_df['date'], traditional_costs / 1e3, 
                 label='Marché traditionnel', color='blue')
-        plt.plot(self.tokenized_metrics_df['date'], token_cum_costs / 1e6, 
+        axes[0].plot(self.tokenized_metrics_df['date'], tokenized_costs / 1e3, 
                 label='Marché tokenisé', color='green')
-        plt.title('Coûts de transaction cumulés')
-        plt.xlabel('Date')
-        plt.ylabel('Coûts cumulés (millions)')
-        plt.legend()
-        plt.grid(True)
+        axes[0].set_title('Coûts de transaction quotidiens')
+        axes[0].set_xlabel('Date')
+        axes[0].set_ylabel('Coûts de transaction (milliers)')
+        axes[0].legend()
+        axes[0].grid(True)
         
-        plt.savefig(os.path.join(results_dir, 'cumulative_costs.png'), dpi=300)
-        plt.close()
+        axes[1].plot(self.traditional_metrics_df['date'], trad_cum_costs / 1e6, 
+                label='Marché traditionnel', color='blue')
+        axes[1].plot(self.tokenized_metrics_df['date'], token_cum_costs / 1e6, 
+                label='Marché tokenisé', color='green')
+        axes[1].set_title('Coûts de transaction cumulés')
+        axes[1].set_xlabel('Date')
+        axes[1].set_ylabel('Coûts cumulés (millions)')
+        axes[1].legend()
+        axes[1].grid(True)
+        
+        fig.tight_layout()
+        _savefig(fig, transaction_costs_path, plot_dpi)
+        plt.close(fig)
     
     def _generate_summary_statistics(self, results_dir):
         """
@@ -751,129 +1300,115 @@ class BondMarketSimulator:
         Args:
             results_dir: Répertoire pour les résultats
         """
-        # Calcul des statistiques
-        traditional_stats = {
-            'transactions_total': self.traditional_metrics_df['num_transactions'].sum(),
-            'volume_total': self.traditional_metrics_df['total_volume'].sum(),
-            'avg_daily_transactions': self.traditional_metrics_df['num_transactions'].mean(),
-            'avg_daily_volume': self.traditional_metrics_df['total_volume'].mean(),
-            'avg_spread': self.traditional_metrics_df['avg_spread'].mean() * 100,  # En pourcentage
-            'avg_market_depth': self.traditional_metrics_df['market_depth'].mean(),
-            'volatility': self.traditional_metrics_df['avg_price'].pct_change().std() * 100 * np.sqrt(252)  # Annualisée
-        }
-        
-        tokenized_stats = {
-            'transactions_total': self.tokenized_metrics_df['num_transactions'].sum(),
-            'volume_total': self.tokenized_metrics_df['total_volume'].sum(),
-            'avg_daily_transactions': self.tokenized_metrics_df['num_transactions'].mean(),
-            'avg_daily_volume': self.tokenized_metrics_df['total_volume'].mean(),
-            'avg_spread': self.tokenized_metrics_df['avg_spread'].mean() * 100,  # En pourcentage
-            'avg_market_depth': self.tokenized_metrics_df['market_depth'].mean(),
-            'volatility': self.tokenized_metrics_df['avg_price'].pct_change().std() * 100 * np.sqrt(252)  # Annualisée
-        }
-        
-        # Calcul des ratios d'amélioration
-        improvement_ratios = {
-            'transactions_ratio': tokenized_stats['transactions_total'] / traditional_stats['transactions_total'],
-            'volume_ratio': tokenized_stats['volume_total'] / traditional_stats['volume_total'],
-            'spread_reduction': 1 - (tokenized_stats['avg_spread'] / traditional_stats['avg_spread']),
-            'depth_improvement': tokenized_stats['avg_market_depth'] / traditional_stats['avg_market_depth'],
-            'volatility_ratio': tokenized_stats['volatility'] / traditional_stats['volatility']
-        }
-        
-        # Création d'un tableau récapitulatif
-        stats_summary = pd.DataFrame({
-            'Métrique': [
-                'Nombre total de transactions',
-                'Volume total',
-                'Transactions quotidiennes moyennes',
-                'Volume quotidien moyen',
-                'Spread bid-ask moyen (%)',
-                'Profondeur de marché moyenne',
-                'Volatilité annualisée (%)'
-            ],
-            'Marché traditionnel': [
-                f"{traditional_stats['transactions_total']:,.0f}",
-                f"{traditional_stats['volume_total']:,.0f}",
-                f"{traditional_stats['avg_daily_transactions']:,.1f}",
-                f"{traditional_stats['avg_daily_volume']:,.0f}",
-                f"{traditional_stats['avg_spread']:.3f}",
-                f"{traditional_stats['avg_market_depth']:.1f}",
-                f"{traditional_stats['volatility']:.2f}"
-            ],
-            'Marché tokenisé': [
-                f"{tokenized_stats['transactions_total']:,.0f}",
-                f"{tokenized_stats['volume_total']:,.0f}",
-                f"{tokenized_stats['avg_daily_transactions']:,.1f}",
-                f"{tokenized_stats['avg_daily_volume']:,.0f}",
-                f"{tokenized_stats['avg_spread']:.3f}",
-                f"{tokenized_stats['avg_market_depth']:.1f}",
-                f"{tokenized_stats['volatility']:.2f}"
-            ],
-            'Amélioration': [
-                f"{improvement_ratios['transactions_ratio']:.2f}x",
-                f"{improvement_ratios['volume_ratio']:.2f}x",
-                f"{improvement_ratios['transactions_ratio']:.2f}x",
-                f"{improvement_ratios['volume_ratio']:.2f}x",
-                f"{improvement_ratios['spread_reduction']:.1%} réduction",
-                f"{improvement_ratios['depth_improvement']:.2f}x",
-                f"{1 - improvement_ratios['volatility_ratio']:.1%} {'réduction' if improvement_ratios['volatility_ratio'] < 1 else 'augmentation'}"
-            ]
-        })
-        
-        # Enregistrement des statistiques dans un fichier texte
-        stats_summary.to_csv(os.path.join(results_dir, 'summary_statistics.csv'), index=False)
+        # Chemins des fichiers produits
+        summary_csv_path = os.path.join(results_dir, 'summary_statistics.csv')
+        report_path = os.path.join(results_dir, 'summary_report.txt')
+        traditional_parquet_path = os.path.join(results_dir, 'traditional_market_metrics.parquet')
+        tokenized_parquet_path = os.path.join(results_dir, 'tokenized_market_metrics.parquet')
+        
+        # Calcul des statistiques (un vecteur par marché) et des ratios tokenisé / traditionnel
+        traditional_stats = _row_stats(self.traditional_metrics_df)
+        tokenized_stats = _row_stats(self.tokenized_metrics_df)
+        ratios = tokenized_stats / traditional_stats
+        
+        # Ratios d'amélioration
+        transactions_ratio, volume_ratio = ratios[0], ratios[1]
+        spread_reduction = 1 - ratios[4]
+        depth_improvement = ratios[5]
+        volatility_ratio = ratios[6]
+        
+        # Colonne d'amélioration : ratios formatés en une passe, sauf spread et volatilité
+        # exprimés en pourcentage d'évolution
+        improvement = np.char.mod('%.2fx', ratios).astype(object)
+        improvement[4] = f"{spread_reduction:.1%} réduction"
+        improvement[6] = f"{1 - volatility_ratio:.1%} {'réduction' if volatility_ratio < 1 else 'augmentation'}"
+        
+        # Tableau récapitulatif : une ligne par métrique
+        header = ['Métrique', 'Marché traditionnel', 'Marché tokenisé', 'Amélioration']
+        metric_names = [
+            'Nombre total de transactions',
+            'Volume total',
+            'Transactions quotidiennes moyennes',
+            'Volume quotidien moyen',
+            'Spread bid-ask moyen (%)',
+            'Profondeur de marché moyenne',
+            'Volatilité annualisée (%)'
+        ]
+        
+        # Enregistrement des statistiques au format CSV (valeurs à 3 décimales)
+        with open(summary_csv_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(zip(metric_names, np.char.mod('%.3f', traditional_stats),
+                                 np.char.mod('%.3f', tokenized_stats), improvement))
+        
+        # Version texte alignée à droite, colonnes dimensionnées sur leur plus longue valeur
+        # (chaque valeur est formatée selon le type de sa ligne)
+        row_formatters = [_FORMATTERS[kind] for kind in _ROW_FORMATS]
+        traditional_strs = [fmt(value) for fmt, value in zip(row_formatters, traditional_stats)]
+        tokenized_strs = [fmt(value) for fmt, value in zip(row_formatters, tokenized_stats)]
+        rows = [header] + [list(row) for row in zip(metric_names, traditional_strs, tokenized_strs, improvement)]
+        widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+        summary_table = '\n'.join(' '.join(cell.rjust(width) for cell, width in zip(row, widths)) for row in rows)
+        
+        # Pourcentages d'évolution cités dans l'interprétation
+        pct_transactions = (transactions_ratio - 1) * 100
+        pct_volume = (volume_ratio - 1) * 100
+        pct_depth = (depth_improvement - 1) * 100
+        pct_spread = spread_reduction * 100
+        pct_volatility = abs(1 - volatility_ratio) * 100
+        volatility_trend = 'diminué' if volatility_ratio < 1 else 'augmenté'
         
         # Enregistrement des statistiques dans un fichier texte lisible
-        with open(os.path.join(results_dir, 'summary_report.txt'), 'w') as f:
-            f.write("RAPPORT DE SIMULATION DU MARCHÉ OBLIGATAIRE TOKENISÉ\n")
-            f.write("===================================================\n\n")
-            f.write(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Obligations: {self.num_bonds * 2} (dont {self.num_bonds} tokenisées)\n")
-            f.write(f"Investisseurs: {self.num_investors}\n")
-            f.write(f"Période de simulation: {self.simulation_days} jours\n\n")
-            
-            f.write("RÉSUMÉ DES RÉSULTATS\n")
-            f.write("-----------------\n\n")
-            f.write(stats_summary.to_string(index=False))
-            f.write("\n\n")
-            
-            f.write("INTERPRÉTATION\n")
-            f.write("-------------\n\n")
-            f.write("La tokenisation des obligations a montré les impacts suivants sur le marché:\n\n")
-            
-            # Liquidité
-            f.write("1. Liquidité:\n")
-            f.write(f"   - Le nombre de transactions a augmenté de {(improvement_ratios['transactions_ratio']-1)*100:.1f}%\n")
-            f.write(f"   - Le volume total a augmenté de {(improvement_ratios['volume_ratio']-1)*100:.1f}%\n")
-            f.write(f"   - La profondeur du marché a augmenté de {(improvement_ratios['depth_improvement']-1)*100:.1f}%\n\n")
-            
-            # Coûts de transaction
-            f.write("2. Coûts de transaction:\n")
-            f.write(f"   - Les spreads bid-ask ont diminué de {improvement_ratios['spread_reduction']*100:.1f}%\n")
-            
-            # Volatilité
-            f.write("3. Volatilité des prix:\n")
-            if improvement_ratios['volatility_ratio'] < 1:
-                f.write(f"   - La volatilité a diminué de {(1-improvement_ratios['volatility_ratio'])*100:.1f}%\n")
-            else:
-                f.write(f"   - La volatilité a augmenté de {(improvement_ratios['volatility_ratio']-1)*100:.1f}%\n")
-            
-            f.write("\nCONCLUSION\n")
-            f.write("----------\n\n")
-            f.write("Cette simulation démontre que la tokenisation des obligations peut significativement améliorer\n")
-            f.write("la liquidité du marché obligataire, réduire les coûts de transaction et potentiellement\n")
-            f.write("stabiliser les prix, rendant le marché plus efficace et accessible à un plus large éventail d'investisseurs.\n")
+        with open(report_path, 'w', buffering=1 << 16) as f:
+            f.write(f"""RAPPORT DE SIMULATION DU MARCHÉ OBLIGATAIRE TOKENISÉ
+===================================================
+
+Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+Obligations: {self.num_bonds * 2} (dont {self.num_bonds} tokenisées)
+Investisseurs: {self.num_investors}
+Période de simulation: {self.simulation_days} jours
+
+RÉSUMÉ DES RÉSULTATS
+-----------------
+
+""")
+            f.write(summary_table)
+            f.write(f"""
+
+INTERPRÉTATION
+-------------
+
+La tokenisation des obligations a montré les impacts suivants sur le marché:
+
+1. Liquidité:
+   - Le nombre de transactions a augmenté de {pct_transactions:.1f}%
+   - Le volume total a augmenté de {pct_volume:.1f}%
+   - La profondeur du marché a augmenté de {pct_depth:.1f}%
+
+2. Coûts de transaction:
+   - Les spreads bid-ask ont diminué de {pct_spread:.1f}%
+3. Volatilité des prix:
+   - La volatilité a {volatility_trend} de {pct_volatility:.1f}%
+
+CONCLUSION
+----------
+
+Cette simulation démontre que la tokenisation des obligations peut significativement améliorer
+la liquidité du marché obligataire, réduire les coûts de transaction et potentiellement
+stabiliser les prix, rendant le marché plus efficace et accessible à un plus large éventail d'investisseurs.
+""")
         
-        print(f"Résumé des statistiques enregistré dans {os.path.join(results_dir, 'summary_report.txt')}")
+        print(f"Résumé des statistiques enregistré dans {report_path}")
         
-        # Enregistrement des données brutes pour une analyse ultérieure
-        self.traditional_metrics_df.to_csv(os.path.join(results_dir, 'traditional_market_metrics.csv'), index=False)
-        self.tokenized_metrics_df.to_csv(os.path.join(results_dir, 'tokenized_market_metrics.csv'), index=False)
+        # Enregistrement des données brutes pour une analyse ultérieure (Parquet, format colonnaire)
+        self.traditional_metrics_df.to_parquet(traditional_parquet_path, engine='pyarrow', compression='snappy', index=False)
+        self.tokenized_metrics_df.to_parquet(tokenized_parquet_path, engine='pyarrow', compression='snappy', index=False)
 
 
 def run_simulation(num_bonds=100, num_investors=1000, simulation_days=365, 
-                  traditional_min=10000, tokenized_min=100, analyze=True):
+                  traditional_min=10000, tokenized_min=100, analyze=True, seed=None, plot=True,
+                  use_processes=False, plot_dpi=100):
     """
     Exécute une simulation complète du marché obligataire tokenisé
     
@@ -884,6 +1419,11 @@ def run_simulation(num_bonds=100, num_investors=1000, simulation_days=365,
         traditional_min: Montant minimum d'investissement dans les obligations traditionnelles
         tokenized_min: Montant minimum d'investissement dans les obligations tokenisées
         analyze: Si True, analyse les résultats après la simulation
+        seed: Graine du générateur aléatoire pour une simulation reproductible
+        plot: Si False, l'analyse exporte les données en Parquet au lieu de produire des graphiques
+        use_processes: Si True, simule les deux marchés dans deux processus au lieu de deux threads
+            (lancés en 'spawn' : le script appelant doit être protégé par if __name__ == "__main__")
+        plot_dpi: Résolution des graphiques (300 pour une qualité publication)
     """
     # Création et exécution du simulateur
     simulator = BondMarketSimulator(
@@ -891,7 +1431,10 @@ def run_simulation(num_bonds=100, num_investors=1000, simulation_days=365,
         num_investors=num_investors,
         simulation_days=simulation_days,
         traditional_min_amount=traditional_min,
-        tokenized_min_amount=tokenized_min
+        tokenized_min_amount=tokenized_min,
+        seed=seed,
+        plot=plot,
+        use_processes=use_processes
     )
     
     # Exécution de la simulation
@@ -899,12 +1442,14 @@ def run_simulation(num_bonds=100, num_investors=1000, simulation_days=365,
     
     # Analyse des résultats
     if analyze:
-        simulator.analyze_results()
+        simulator.analyze_results(plot_dpi=plot_dpi)
     
     return simulator
 
 
 if __name__ == "__main__":
+    import argparse
+    
     # Configuration des arguments en ligne de commande
     parser = argparse.ArgumentParser(description='Simulateur de marché obligataire tokenisé')
     parser.add_argument('--bonds', type=int, default=100, help='Nombre d\'obligations (défaut: 100)')
@@ -913,6 +1458,13 @@ if __name__ == "__main__":
     parser.add_argument('--trad-min', type=int, default=10000, help='Montant minimum traditionnel (défaut: 10000)')
     parser.add_argument('--token-min', type=int, default=100, help='Montant minimum tokenisé (défaut: 100)')
     parser.add_argument('--no-analysis', action='store_true', help='Désactiver l\'analyse automatique')
+    parser.add_argument('--seed', type=int, default=None, help='Graine aléatoire pour une simulation reproductible')
+    parser.add_argument('--fast-output', action='store_true',
+                        help='Exporter les transactions en Parquet sans produire de graphiques')
+    parser.add_argument('--processes', action='store_true',
+                        help='Simuler les deux marchés dans deux processus (défaut: deux threads)')
+    parser.add_argument('--publication', action='store_true',
+                        help='Graphiques en qualité publication (300 dpi au lieu de 100)')
     
     args = parser.parse_args()
     
@@ -923,5 +1475,9 @@ if __name__ == "__main__":
         simulation_days=args.days,
         traditional_min=args.trad_min,
         tokenized_min=args.token_min,
-        analyze=not args.no_analysis
+        analyze=not args.no_analysis,
+        seed=args.seed,
+        plot=not args.fast_output,
+        use_processes=args.processes,
+        plot_dpi=300 if args.publication else 100
     )
\ No newline at end of file